@@ -125,20 +125,7 @@ def render(
 
     # Output results
     if json_output:
-        output_data = {
-            "success": result.success,
-            "output_path": str(result.output_path) if result.output_path else None,
-            "duration_sec": result.duration_sec,
-            "render_time_sec": round(result.render_time_sec, 3),
-            "mode": result.mode,
-        }
-        if result.error:
-            output_data["error"] = {
-                "message": result.error.message,
-                "file": result.error.file,
-                "line": result.error.line,
-                "char": result.error.char,
-            }
+        output_data = result.to_dict()
         if verbose:
             output_data["sclang_output"] = result.sclang_output
         print(json.dumps(output_data, indent=2))
@@ -500,20 +487,7 @@ def iterate(
             duration=duration,
         )
 
-        render_data = {
-            "success": render_result.success,
-            "output_path": str(render_result.output_path) if render_result.output_path else None,
-            "duration_sec": render_result.duration_sec,
-            "render_time_sec": round(render_result.render_time_sec, 3),
-            "mode": render_result.mode,
-        }
-        if render_result.error:
-            render_data["error"] = {
-                "message": render_result.error.message,
-                "file": render_result.error.file,
-                "line": render_result.error.line,
-                "char": render_result.error.char,
-            }
+        render_data = render_result.to_dict()
 
         if not render_result.success:
             output_data = {
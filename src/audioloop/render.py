@@ -11,7 +11,7 @@ from audioloop.sclang import run_sclang
 from audioloop.wrapper import needs_wrapping, wrap_function, replace_placeholders
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderResult:
     """Result of a render operation."""
 
@@ -23,6 +23,27 @@ class RenderResult:
     sclang_output: str
     mode: str  # "full_nrt" or "wrapped"
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization.
+
+        sclang_output is omitted; callers add it when verbose output is wanted.
+        """
+        data = {
+            "success": self.success,
+            "output_path": str(self.output_path) if self.output_path else None,
+            "duration_sec": self.duration_sec,
+            "render_time_sec": round(self.render_time_sec, 3),
+            "mode": self.mode,
+        }
+        if self.error:
+            data["error"] = {
+                "message": self.error.message,
+                "file": self.error.file,
+                "line": self.error.line,
+                "char": self.error.char,
+            }
+        return data
+
 
 def get_wav_duration(path: Path) -> float | None:
     """Get the duration of a WAV file in seconds.
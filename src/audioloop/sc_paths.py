@@ -1,5 +1,6 @@
 """SuperCollider installation path discovery and validation."""
 
+import functools
 import os
 from pathlib import Path
 
@@ -7,11 +8,17 @@ from pathlib import Path
 # Default SuperCollider application path on macOS
 SC_APP_PATH = Path("/Applications/SuperCollider.app")
 
+# Cached result of validate_sc_installation (None until first validation)
+_VALIDATED: tuple[bool, str | None] | None = None
 
+
+@functools.lru_cache(maxsize=1)
 def get_sc_app_path() -> Path:
     """Get the SuperCollider application path.
 
     Checks AUDIOLOOP_SC_APP environment variable first, falls back to default.
+    The result is cached; call invalidate_sc_cache() after changing the
+    environment variable.
 
     Returns:
         Path to SuperCollider.app directory.
@@ -22,6 +29,7 @@ def get_sc_app_path() -> Path:
     return SC_APP_PATH
 
 
+@functools.lru_cache(maxsize=1)
 def get_sclang_path() -> Path:
     """Get the path to the sclang executable.
 
@@ -31,6 +39,7 @@ def get_sclang_path() -> Path:
     return get_sc_app_path() / "Contents" / "MacOS" / "sclang"
 
 
+@functools.lru_cache(maxsize=1)
 def get_scsynth_path() -> Path:
     """Get the path to the scsynth executable.
 
@@ -40,6 +49,7 @@ def get_scsynth_path() -> Path:
     return get_sc_app_path() / "Contents" / "Resources" / "scsynth"
 
 
+@functools.lru_cache(maxsize=1)
 def get_sclang_dir() -> Path:
     """Get the directory containing sclang.
 
@@ -52,14 +62,46 @@ def get_sclang_dir() -> Path:
     return get_sclang_path().parent
 
 
+@functools.lru_cache(maxsize=1)
+def get_sclang_path_str() -> str:
+    """Get the sclang executable path as a string, for subprocess argv.
+
+    Returns:
+        String form of get_sclang_path().
+    """
+    return str(get_sclang_path())
+
+
+@functools.lru_cache(maxsize=1)
+def get_sclang_dir_str() -> str:
+    """Get the sclang directory as a string, for subprocess cwd.
+
+    Returns:
+        String form of get_sclang_dir().
+    """
+    return str(get_sclang_dir())
+
+
 def validate_sc_installation() -> tuple[bool, str | None]:
     """Validate that SuperCollider is installed and accessible.
 
+    The result is cached for the lifetime of the process so repeated
+    renders don't re-stat the installation. Use invalidate_sc_cache()
+    to force a re-check.
+
     Returns:
         Tuple of (is_valid, error_message).
         If valid, returns (True, None).
         If invalid, returns (False, helpful_error_message).
     """
+    global _VALIDATED
+    if _VALIDATED is None:
+        _VALIDATED = _check_sc_installation()
+    return _VALIDATED
+
+
+def _check_sc_installation() -> tuple[bool, str | None]:
+    """Check the SuperCollider installation on disk (uncached)."""
     sc_app = get_sc_app_path()
     sclang = get_sclang_path()
     scsynth = get_scsynth_path()
@@ -99,6 +141,21 @@ def validate_sc_installation() -> tuple[bool, str | None]:
     return True, None
 
 
+def invalidate_sc_cache() -> None:
+    """Clear cached SuperCollider paths and validation result.
+
+    Needed when AUDIOLOOP_SC_APP changes at runtime (e.g. in tests).
+    """
+    global _VALIDATED
+    _VALIDATED = None
+    get_sc_app_path.cache_clear()
+    get_sclang_path.cache_clear()
+    get_scsynth_path.cache_clear()
+    get_sclang_dir.cache_clear()
+    get_sclang_path_str.cache_clear()
+    get_sclang_dir_str.cache_clear()
+
+
 def require_sc_installation() -> None:
     """Validate SC installation and raise if not found.
 
@@ -6,7 +6,11 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from audioloop.sc_paths import get_sclang_path, get_sclang_dir, validate_sc_installation
+from audioloop.sc_paths import (
+    get_sclang_dir_str,
+    get_sclang_path_str,
+    validate_sc_installation,
+)
 
 
 @dataclass
@@ -20,6 +24,21 @@ class SclangResult:
     timed_out: bool
 
 
+def sclang_env() -> dict[str, str] | None:
+    """Build the environment for an sclang subprocess.
+
+    On Linux, sets QT_QPA_PLATFORM=offscreen for headless operation. On
+    macOS, the cocoa platform works without a display (offscreen is not
+    available), so the parent environment is inherited as-is.
+
+    Returns:
+        Environment mapping for subprocess.run, or None to inherit.
+    """
+    if sys.platform == "linux":
+        return {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+    return None
+
+
 def run_sclang(script_path: Path, timeout: float = 60.0) -> SclangResult:
     """Execute a SuperCollider script with sclang.
 
@@ -50,30 +69,23 @@ def run_sclang(script_path: Path, timeout: float = 60.0) -> SclangResult:
     if not is_valid:
         raise RuntimeError(error)
 
-    sclang_path = get_sclang_path()
-    sclang_dir = get_sclang_dir()
-
-    # Set up environment
-    env = os.environ.copy()
-    # On Linux, use offscreen Qt platform for headless operation
-    # On macOS, the cocoa platform works without display (offscreen not available)
-    if sys.platform == "linux":
-        env["QT_QPA_PLATFORM"] = "offscreen"
+    sclang_path = get_sclang_path_str()
+    sclang_dir = get_sclang_dir_str()
 
     try:
         result = subprocess.run(
-            [str(sclang_path), str(script_path)],
-            cwd=str(sclang_dir),
+            [sclang_path, str(script_path)],
+            cwd=sclang_dir,
             capture_output=True,
             timeout=timeout,
-            text=True,
-            env=env,
+            env=sclang_env(),
         )
 
+        # Capture raw bytes and decode once, matching the timeout path below
         return SclangResult(
             success=result.returncode == 0,
-            stdout=result.stdout,
-            stderr=result.stderr,
+            stdout=result.stdout.decode("utf-8", errors="replace"),
+            stderr=result.stderr.decode("utf-8", errors="replace"),
             exit_code=result.returncode,
             timed_out=False,
         )
@@ -4,13 +4,29 @@ Generates stacked waveform/spectrogram/chromagram visualizations
 as PNG files for Claude to analyze alongside numeric features.
 """
 
+import functools
 from pathlib import Path
 
-import librosa
-import librosa.display
-import matplotlib.pyplot as plt
 import numpy as np
 
+# Chroma bin labels in librosa's order (bin 0 = C)
+PITCH_CLASSES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+
+@functools.lru_cache(maxsize=8)
+def _mel_filterbank(sr: int, n_fft: int, n_mels: int) -> np.ndarray:
+    """Build (and cache) the mel filterbank for a given STFT configuration.
+
+    Returns:
+        Float32 array of shape (n_mels, 1 + n_fft // 2).
+    """
+    import librosa
+
+    mel_fb = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels)
+    # Shared across calls, so guard against accidental in-place edits
+    mel_fb.setflags(write=False)
+    return mel_fb
+
 
 def generate_spectrogram(
     audio_path: Path, output_path: Path, sr: int | None = None
@@ -30,6 +46,15 @@ def generate_spectrogram(
     Returns:
         Path to the generated PNG file.
     """
+    # Plotting stack is imported lazily - it costs ~1s and most CLI
+    # invocations never generate a spectrogram
+    import librosa
+    import librosa.display
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     # Load audio (mono for visualization)
     y, sample_rate = librosa.load(str(audio_path), sr=sr, mono=True)
 
@@ -41,8 +66,12 @@ def generate_spectrogram(
     axes[0].set_ylabel("Amplitude")
     axes[0].set_title("Waveform")
 
+    # Power spectrogram shared by the mel and chroma features, so the STFT
+    # runs once instead of once per feature (librosa's default framing)
+    S_power = np.abs(librosa.stft(y, n_fft=2048, hop_length=512)) ** 2
+
     # Middle: Mel spectrogram
-    S = librosa.feature.melspectrogram(y=y, sr=sample_rate, n_mels=128)
+    S = _mel_filterbank(sample_rate, 2048, 128) @ S_power
     S_db = librosa.power_to_db(S, ref=np.max)
     img = librosa.display.specshow(
         S_db,
@@ -57,18 +86,22 @@ def generate_spectrogram(
     fig.colorbar(img, ax=axes[1], format="%+2.0f dB", pad=0.01)
 
     # Bottom: Chromagram
-    chroma = librosa.feature.chroma_stft(y=y, sr=sample_rate)
-    img_chroma = librosa.display.specshow(
+    # Values are normalized to [0, 1] per frame, so no colorbar is needed;
+    # imshow of the 12xT array is cheaper to rasterize than specshow's mesh
+    chroma = librosa.feature.chroma_stft(S=S_power, sr=sample_rate)
+    duration = len(y) / sample_rate
+    axes[2].imshow(
         chroma,
-        sr=sample_rate,
-        x_axis="time",
-        y_axis="chroma",
-        ax=axes[2],
+        aspect="auto",
+        origin="lower",
         cmap="coolwarm",
+        interpolation="nearest",
+        extent=[0, duration, 0, 12],
     )
+    axes[2].set_yticks(np.arange(12) + 0.5)
+    axes[2].set_yticklabels(PITCH_CLASSES)
     axes[2].set_ylabel("Pitch Class")
     axes[2].set_title("Chromagram")
-    fig.colorbar(img_chroma, ax=axes[2], pad=0.01)
 
     # Only show x-axis label on bottom subplot
     for ax in axes[:-1]:
@@ -1,19 +1,21 @@
 """NRT (Non-Real-Time) wrapper for simple function syntax."""
 
+import re
 from pathlib import Path
 
 # Template for wrapping a simple function in NRT boilerplate
 # Note: All var declarations must come before any expressions in SuperCollider
+# Note: This is a str.format template - literal SC braces are doubled
 NRT_WRAPPER_TEMPLATE = '''// Auto-generated NRT wrapper by audioloop
 (
-var userFunc = __USER_CODE__;
-var duration = __DURATION__;
-var outputPath = "__OUTPUT_PATH__";
+var userFunc = {user_code};
+var duration = {duration};
+var outputPath = "{output_path}";
 var score;
 
-SynthDef(\\audioloop_render, { |out=0|
+SynthDef(\\audioloop_render, {{ |out=0|
     Out.ar(out, userFunc.value);
-}).store;
+}}).store;
 
 score = Score([
     [0.0, [\\s_new, \\audioloop_render, 1000, 0, 0]],
@@ -26,11 +28,19 @@ score.recordNRT(
     sampleFormat: "int24",
     options: ServerOptions.new.numOutputBusChannels_(2),
     duration: duration,
-    action: { "Render complete".postln; 0.exit; }
+    action: {{ "Render complete".postln; 0.exit; }}
 );
 )
 '''
 
+# Placeholders substituted by replace_placeholders, matched in a single pass
+_PLACEHOLDER_RE = re.compile(r"__(OUTPUT_PATH|DURATION)__")
+
+# Marker for full NRT code. A single literal is checked with `in`, which is
+# faster than a compiled regex search; switch to one alternation regex only
+# if more markers are added.
+_FULL_NRT_MARKER = "recordNRT"
+
 
 def needs_wrapping(code: str) -> bool:
     """Check if code needs NRT wrapping.
@@ -45,7 +55,7 @@ def needs_wrapping(code: str) -> bool:
     Returns:
         True if wrapping is needed, False otherwise.
     """
-    return "recordNRT" not in code
+    return _FULL_NRT_MARKER not in code
 
 
 def wrap_function(code: str, duration: float, output_path: Path) -> str:
@@ -62,12 +72,11 @@ def wrap_function(code: str, duration: float, output_path: Path) -> str:
     Returns:
         Complete SuperCollider script ready for NRT rendering.
     """
-    return (
-        NRT_WRAPPER_TEMPLATE
-        .replace("__USER_CODE__", code.strip())
-        .replace("__DURATION__", str(duration))
-        .replace("__OUTPUT_PATH__", str(output_path))
-    )
+    return NRT_WRAPPER_TEMPLATE.format_map({
+        "user_code": code.strip(),
+        "duration": str(duration),
+        "output_path": str(output_path),
+    })
 
 
 def replace_placeholders(
@@ -82,7 +91,6 @@ def replace_placeholders(
 
     For wrapped mode (if duration provided), also replaces:
     - __DURATION__ with the duration value
-    - __USER_CODE__ with user's function (handled by wrap_function)
 
     Args:
         code: SuperCollider source code with placeholders.
@@ -92,9 +100,10 @@ def replace_placeholders(
     Returns:
         Code with placeholders replaced.
     """
-    result = code.replace("__OUTPUT_PATH__", str(output_path))
+    mapping = {"OUTPUT_PATH": str(output_path)}
 
     if duration is not None:
-        result = result.replace("__DURATION__", str(duration))
+        mapping["DURATION"] = str(duration)
 
-    return result
+    # Unmapped placeholders (e.g. __DURATION__ without a duration) are kept as-is
+    return _PLACEHOLDER_RE.sub(lambda m: mapping.get(m.group(1), m.group(0)), code)
@@ -0,0 +1,14 @@
+"""SuperCollider availability checks shared by test modules."""
+
+import pytest
+
+from audioloop.sc_paths import validate_sc_installation
+
+
+# Check once whether SuperCollider is available (validation is itself
+# cached in sc_paths, so this is the only probe per session)
+SC_OK, _SC_REASON = validate_sc_installation()
+SC_SKIP_REASON = _SC_REASON or "SuperCollider not installed"
+
+# Skip marker for tests requiring a real SC render
+requires_sc = pytest.mark.skipif(not SC_OK, reason=SC_SKIP_REASON)
@@ -8,65 +8,71 @@ from pathlib import Path
 from audioloop.analyze import analyze, AnalysisResult, AnalysisError
 
 
+# Test tones are generated once at import and shared by all fixtures
+SAMPLE_RATE = 44100
+_T = np.arange(SAMPLE_RATE) / SAMPLE_RATE  # 1 second
+
+
+def _sine(freq: float) -> np.ndarray:
+    """Generate a 1 second, 0.5 amplitude sine as float32.
+
+    Phase is wrapped to [0, 2pi) in float64 so the float32 sin kernel
+    (SIMD-vectorized in NumPy) stays accurate. float32 also halves the
+    bytes sf.write has to convert to 16-bit PCM.
+    """
+    phase = (2 * np.pi * freq * _T) % (2 * np.pi)
+    return 0.5 * np.sin(phase.astype(np.float32))
+
+
+_SINE_440 = _sine(440.0)
+_SINE_880 = _sine(880.0)
+
+
 @pytest.fixture
 def fixtures_dir(tmp_path):
     """Return path to fixtures directory, creating test fixtures if needed."""
     return tmp_path
 
 
-@pytest.fixture
-def test_tone_stereo(fixtures_dir):
+@pytest.fixture(scope="session")
+def tones_dir(tmp_path_factory):
+    """Session-scoped directory for generated test tones (read-only in tests)."""
+    return tmp_path_factory.mktemp("tones")
+
+
+@pytest.fixture(scope="session")
+def test_tone_stereo(tones_dir):
     """Generate a stereo 440Hz sine wave test fixture.
 
     Returns:
         Path to the generated WAV file.
     """
-    sr = 44100
-    duration = 1.0
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-
-    # 440Hz sine wave
-    freq = 440.0
-    sine = 0.5 * np.sin(2 * np.pi * freq * t)
-
-    # Stereo: identical L/R
-    stereo = np.column_stack([sine, sine])
+    # Stereo: identical L/R (broadcast view, materialized once for sf.write)
+    stereo = np.ascontiguousarray(
+        np.broadcast_to(_SINE_440[:, None], (_SINE_440.size, 2))
+    )
 
-    path = fixtures_dir / "test_tone_stereo.wav"
-    sf.write(path, stereo, sr)
+    path = tones_dir / "test_tone_stereo.wav"
+    sf.write(path, stereo, SAMPLE_RATE)
     return path
 
 
-@pytest.fixture
-def test_tone_mono(fixtures_dir):
+@pytest.fixture(scope="session")
+def test_tone_mono(tones_dir):
     """Generate a mono 440Hz sine wave test fixture."""
-    sr = 44100
-    duration = 1.0
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-
-    freq = 440.0
-    sine = 0.5 * np.sin(2 * np.pi * freq * t)
-
-    path = fixtures_dir / "test_tone_mono.wav"
-    sf.write(path, sine, sr)
+    path = tones_dir / "test_tone_mono.wav"
+    sf.write(path, _SINE_440, SAMPLE_RATE)
     return path
 
 
-@pytest.fixture
-def test_stereo_wide(fixtures_dir):
+@pytest.fixture(scope="session")
+def test_stereo_wide(tones_dir):
     """Generate a stereo file with different L/R content (wide stereo)."""
-    sr = 44100
-    duration = 1.0
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-
     # Different frequencies for L/R
-    left = 0.5 * np.sin(2 * np.pi * 440.0 * t)
-    right = 0.5 * np.sin(2 * np.pi * 880.0 * t)
-
-    stereo = np.column_stack([left, right])
+    stereo = np.column_stack([_SINE_440, _SINE_880])
 
-    path = fixtures_dir / "test_stereo_wide.wav"
-    sf.write(path, stereo, sr)
+    path = tones_dir / "test_stereo_wide.wav"
+    sf.write(path, stereo, SAMPLE_RATE)
     return path
 
 
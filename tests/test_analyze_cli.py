@@ -1,31 +1,48 @@
 """CLI integration tests for the analyze command."""
 
 import json
-import subprocess
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
+
+from audioloop.cli import app
 
 
 # Use the test fixture created for CLI tests
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "test_tone.wav"
+FIXTURE_PATH_STR = str(FIXTURE_PATH)
+
+# Invoke the CLI in-process instead of spawning a new interpreter per test
+# (success-path invocations pass catch_exceptions=False so a crash surfaces
+# as a real traceback rather than an opaque exit code)
+_RUNNER = CliRunner()
+
+# A session fixture is built once per xdist worker, so analyze_json's
+# consumers share a group to land on one worker and one analysis
+shares_analyze_json = pytest.mark.xdist_group("analyze_json")
+
+
+@pytest.fixture(scope="session")
+def analyze_json():
+    """Run `analyze --json` on the fixture once and share the parsed output."""
+    result = _RUNNER.invoke(
+        app, ["analyze", FIXTURE_PATH_STR, "--json"], catch_exceptions=False
+    )
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+
+    # Should be valid JSON
+    return json.loads(result.stdout)
 
 
 class TestAnalyzeJsonOutput:
     """Tests for JSON output mode."""
 
-    def test_analyze_json_output(self):
+    @shares_analyze_json
+    def test_analyze_json_output(self, analyze_json):
         """Run audioloop analyze with --json, verify valid JSON with expected keys."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", str(FIXTURE_PATH), "--json"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
-
-        # Should be valid JSON
-        data = json.loads(result.stdout)
+        data = analyze_json
 
         # Check all expected top-level keys
         assert "file" in data
@@ -37,15 +54,10 @@ class TestAnalyzeJsonOutput:
         assert "stereo" in data
         assert "loudness_lufs" in data
 
-    def test_analyze_json_schema(self):
+    @shares_analyze_json
+    def test_analyze_json_schema(self, analyze_json):
         """Verify JSON output matches PROJECT.md schema structure."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", str(FIXTURE_PATH), "--json"],
-            capture_output=True,
-            text=True,
-        )
-
-        data = json.loads(result.stdout)
+        data = analyze_json
 
         # Spectral has left/right
         assert "left" in data["spectral"]
@@ -78,13 +90,11 @@ class TestAnalyzeHumanOutput:
 
     def test_analyze_human_output(self):
         """Run audioloop analyze without --json, verify output contains expected sections."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", str(FIXTURE_PATH)],
-            capture_output=True,
-            text=True,
+        result = _RUNNER.invoke(
+            app, ["analyze", FIXTURE_PATH_STR], catch_exceptions=False
         )
 
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
+        assert result.exit_code == 0, f"Command failed: {result.output}"
 
         # Output should contain expected sections
         output = result.stdout
@@ -106,38 +116,25 @@ class TestAnalyzeErrorHandling:
 
     def test_analyze_file_not_found(self):
         """Run with nonexistent file, verify exit code 2."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", "nonexistent_file.wav"],
-            capture_output=True,
-            text=True,
-        )
+        result = _RUNNER.invoke(app, ["analyze", "nonexistent_file.wav"])
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
         assert "not found" in result.stderr.lower() or "not found" in result.stdout.lower()
 
     def test_analyze_directory_not_file(self, tmp_path):
         """Run with a directory instead of file, verify exit code 2."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", str(tmp_path)],
-            capture_output=True,
-            text=True,
-        )
+        result = _RUNNER.invoke(app, ["analyze", str(tmp_path)])
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
 
 
 class TestAnalyzeValues:
     """Tests for analysis value correctness."""
 
-    def test_analyze_values_reasonable(self):
+    @shares_analyze_json
+    def test_analyze_values_reasonable(self, analyze_json):
         """Verify analysis values are in reasonable ranges for test tone."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "analyze", str(FIXTURE_PATH), "--json"],
-            capture_output=True,
-            text=True,
-        )
-
-        data = json.loads(result.stdout)
+        data = analyze_json
 
         # 440Hz sine wave should have centroid near 440-460 Hz
         centroid = data["spectral"]["left"]["centroid_hz"]
@@ -0,0 +1,26 @@
+"""Tests for top-level CLI behavior shared across commands."""
+
+import pytest
+from typer.testing import CliRunner
+
+from audioloop.cli import app
+
+
+_RUNNER = CliRunner()
+
+
+@pytest.fixture(scope="module")
+def help_output():
+    """Render `audioloop --help` once for all help assertions."""
+    result = _RUNNER.invoke(app, ["--help"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    return result.stdout.lower()
+
+
+@pytest.mark.parametrize(
+    "substr", ["render", "analyze", "compare", "play", "iterate", "audio"]
+)
+def test_help_contains(help_output, substr):
+    """Verify each command (and the play description) appears in help output."""
+    assert substr in help_output
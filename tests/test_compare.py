@@ -1,13 +1,14 @@
 """Tests for the compare command."""
 
 import json
-import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from typer.testing import CliRunner
 
 from audioloop.analyze import AnalysisResult
+from audioloop.cli import app, compare as compare_command
 from audioloop.compare import (
     ComparisonResult,
     FeatureDelta,
@@ -18,17 +19,58 @@ from audioloop.compare import (
 
 # Use the test fixture
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "test_tone.wav"
+FIXTURE_PATH_STR = str(FIXTURE_PATH)
+
+_RUNNER = CliRunner()
+
+
+def _fake_analysis_result(duration: float = 1.0) -> MagicMock:
+    """Build a stand-in AnalysisResult with realistic values for a 440Hz tone."""
+    channel = {
+        "centroid_hz": 441.2,
+        "rolloff_hz": 452.1,
+        "flatness": 0.0001,
+        "bandwidth_hz": 35.6,
+    }
+    result = MagicMock(spec=AnalysisResult)
+    result.duration_sec = duration
+    result.to_dict.return_value = {
+        "file": FIXTURE_PATH_STR,
+        "duration_sec": duration,
+        "sample_rate": 44100,
+        "channels": 2,
+        "spectral": {"left": dict(channel), "right": dict(channel)},
+        "temporal": {"attack_ms": 1.2, "rms": 0.354, "crest_factor": 1.414},
+        "stereo": {"width": 0.0, "correlation": 1.0},
+        "loudness_lufs": -9.1,
+        "psychoacoustic": {},
+        "band_energies": {},
+    }
+    return result
+
+
+@pytest.fixture(scope="session")
+def identical_comparison():
+    """Compare the fixture against itself once and share the result.
+
+    Analysis is stubbed: both sides are identical by construction, which is
+    all these tests rely on. test_compare_cli_json_output is the one test
+    that still runs real analysis end to end.
+    """
+    fake = _fake_analysis_result()
+    with patch("audioloop.compare.analyze", side_effect=[fake, fake]):
+        return compare_audio(FIXTURE_PATH, FIXTURE_PATH)
 
 
 class TestCompareAudioFunction:
     """Tests for the compare_audio function."""
 
-    def test_compare_identical_files(self):
+    def test_compare_identical_files(self, identical_comparison):
         """Same file should have all deltas unchanged (zero)."""
-        result = compare_audio(FIXTURE_PATH, FIXTURE_PATH)
+        result = identical_comparison
 
-        assert result.file_a == str(FIXTURE_PATH)
-        assert result.file_b == str(FIXTURE_PATH)
+        assert result.file_a == FIXTURE_PATH_STR
+        assert result.file_b == FIXTURE_PATH_STR
         assert result.duration_a == result.duration_b
 
         # All deltas should be unchanged
@@ -87,17 +129,16 @@ class TestCompareAudioFunction:
         assert rms_delta.direction == "unchanged"
         assert not rms_delta.significant
 
-    def test_to_dict_serialization(self):
+    def test_to_dict_serialization(self, identical_comparison):
         """Test that ComparisonResult.to_dict() produces valid JSON."""
-        result = compare_audio(FIXTURE_PATH, FIXTURE_PATH)
-        data = result.to_dict()
+        data = identical_comparison.to_dict()
 
         # Should be JSON serializable
         json_str = json.dumps(data)
         parsed = json.loads(json_str)
 
-        assert parsed["file_a"] == str(FIXTURE_PATH)
-        assert parsed["file_b"] == str(FIXTURE_PATH)
+        assert parsed["file_a"] == FIXTURE_PATH_STR
+        assert parsed["file_b"] == FIXTURE_PATH_STR
         assert "deltas" in parsed
         assert "summary" in parsed
 
@@ -105,10 +146,9 @@ class TestCompareAudioFunction:
 class TestCompareFormatting:
     """Tests for comparison output formatting."""
 
-    def test_format_comparison_human_output(self):
+    def test_format_comparison_human_output(self, identical_comparison):
         """Verify human-readable format includes key elements."""
-        result = compare_audio(FIXTURE_PATH, FIXTURE_PATH)
-        output = format_comparison_human(result)
+        output = format_comparison_human(identical_comparison)
 
         # Should contain comparison header
         assert "Comparison:" in output
@@ -131,35 +171,31 @@ class TestCompareCLI:
 
     def test_compare_cli_human_output(self):
         """Verify human-readable CLI output contains expected elements."""
-        from typer.testing import CliRunner
-        from audioloop.cli import app
-
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["compare", str(FIXTURE_PATH), str(FIXTURE_PATH)]
-        )
+        # Analysis is stubbed: this covers the CLI wiring, while the JSON
+        # test below remains the end-to-end run of the real pipeline
+        fake = _fake_analysis_result()
+        with patch("audioloop.compare.analyze", side_effect=[fake, fake]):
+            result = _RUNNER.invoke(
+                app,
+                ["compare", FIXTURE_PATH_STR, FIXTURE_PATH_STR],
+                catch_exceptions=False,
+            )
 
         assert result.exit_code == 0
         assert "Comparison:" in result.stdout
         assert "SPECTRAL" in result.stdout
 
-    def test_compare_cli_json_output(self):
+    def test_compare_cli_json_output(self, capsys):
         """Verify JSON output is valid and contains expected structure."""
-        from typer.testing import CliRunner
-        from audioloop.cli import app
-
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["compare", str(FIXTURE_PATH), str(FIXTURE_PATH), "--json"]
-        )
-
-        assert result.exit_code == 0
+        # Call the command function directly (no Click context or argv
+        # parsing - the other CLI tests cover that); it raises on failure
+        compare_command(FIXTURE_PATH, FIXTURE_PATH, json_output=True)
 
         # Parse JSON
-        data = json.loads(result.stdout)
+        data = json.loads(capsys.readouterr().out)
 
-        assert data["file_a"] == str(FIXTURE_PATH)
-        assert data["file_b"] == str(FIXTURE_PATH)
+        assert data["file_a"] == FIXTURE_PATH_STR
+        assert data["file_b"] == FIXTURE_PATH_STR
         assert "deltas" in data
         assert "summary" in data
 
@@ -176,35 +212,17 @@ class TestCompareCLI:
         assert "direction" in first_delta
         assert "significant" in first_delta
 
-    def test_compare_file_not_found(self):
-        """Verify exit code 2 when file doesn't exist."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "compare", "nonexistent.wav", str(FIXTURE_PATH)],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 2
+    @pytest.mark.parametrize(
+        "files",
+        [
+            ("nonexistent.wav", FIXTURE_PATH_STR),
+            (FIXTURE_PATH_STR, "nonexistent.wav"),
+        ],
+        ids=["first", "second"],
+    )
+    def test_compare_file_not_found(self, files):
+        """Verify exit code 2 when either file doesn't exist."""
+        result = _RUNNER.invoke(app, ["compare", *files])
+
+        assert result.exit_code == 2
         assert "not found" in result.stderr.lower() or "not found" in result.stdout.lower()
-
-    def test_compare_second_file_not_found(self):
-        """Verify exit code 2 when second file doesn't exist."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "compare", str(FIXTURE_PATH), "nonexistent.wav"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 2
-        assert "not found" in result.stderr.lower() or "not found" in result.stdout.lower()
-
-    def test_compare_help(self):
-        """Verify compare command appears in help output."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "compare" in result.stdout.lower()
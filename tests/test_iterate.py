@@ -1,10 +1,18 @@
 """CLI integration tests for the iterate command."""
 
 import json
-import subprocess
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pytest
+import soundfile as sf
+from typer.testing import CliRunner
+
+from audioloop.cli import app, iterate as iterate_command
+from audioloop.render import RenderResult, get_wav_duration
+from tests.sc_support import requires_sc
 
 
 # Use existing test fixtures
@@ -12,27 +20,115 @@ FIXTURE_PATH = Path(__file__).parent / "fixtures"
 SIMPLE_FUNCTION = FIXTURE_PATH / "simple_function.scd"
 TEST_TONE = FIXTURE_PATH / "test_tone.wav"
 
+_RUNNER = CliRunner()
 
-class TestIterateInlineCode:
-    """Tests for inline code mode with --code flag."""
+# Inline SC code used by most iterate tests
+INLINE_CODE = "{ SinOsc.ar(440) * 0.3 ! 2 }"
 
-    def test_inline_code_success(self):
-        """Inline code with --code and --duration renders and analyzes successfully."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
+# Keep the iterate tests on one xdist worker so the session-scoped
+# iterate_json_output (and prerendered_wav) below are built once rather
+# than once per worker
+pytestmark = pytest.mark.xdist_group("iterate_json")
+
+
+def _inline_args(*extra: str) -> list[str]:
+    """Build argv for `iterate --code -d 1 INLINE_CODE --json --no-play`.
+
+    Args:
+        extra: Additional CLI arguments appended after the defaults.
+    """
+    return ["iterate", "--code", "-d", "1", INLINE_CODE, "--json", "--no-play", *extra]
+
+
+@pytest.fixture(scope="session")
+def prerendered_wav(tmp_path_factory):
+    """Canonical stand-in for rendering INLINE_CODE for 1 second.
+
+    Synthesized directly so tests of the CLI/JSON plumbing don't depend on
+    (or pay for) a SuperCollider render.
+    """
+    sr = 44100
+    sine = 0.3 * np.sin(2 * np.pi * 440.0 * np.arange(sr) / sr)
+
+    path = tmp_path_factory.mktemp("render") / "sine.wav"
+    sf.write(path, np.column_stack([sine, sine]), sr)
+    return path
+
+
+def _fake_render(wav: Path):
+    """Build a stand-in for audioloop.cli.do_render that copies `wav`."""
+
+    def render(input_path, output_path, timeout=120.0, duration=None):
+        output_path = Path(output_path).resolve()
+        shutil.copyfile(wav, output_path)
+        return RenderResult(
+            success=True,
+            output_path=output_path,
+            duration_sec=get_wav_duration(output_path),
+            render_time_sec=0.0,
+            error=None,
+            sclang_output="",
+            mode="wrapped",
         )
 
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
+    return render
 
-        data = json.loads(result.stdout)
+
+def _iterate_direct(capsys, **options) -> dict:
+    """Call the iterate command function directly and parse its JSON output.
+
+    Skips Typer argv parsing for tests that only check how an option shows
+    up in the JSON. Defaults match `_inline_args()`.
+
+    Args:
+        capsys: pytest capture fixture used to read the printed JSON.
+        options: Keyword overrides for the iterate command's parameters.
+    """
+    kwargs = {
+        "source": INLINE_CODE,
+        "code": True,
+        "duration": 1.0,
+        "output": None,
+        "keep": False,
+        "no_play": True,
+        "no_psychoacoustic": False,
+        "json_output": True,
+        "human": False,
+        "spectrogram": None,
+        **options,
+    }
+    iterate_command(**kwargs)
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def stub_render(monkeypatch, prerendered_wav):
+    """Replace the CLI's render step with a copy of the prerendered WAV."""
+    monkeypatch.setattr("audioloop.cli.do_render", _fake_render(prerendered_wav))
+
+
+@pytest.fixture(scope="session")
+def iterate_json_output(prerendered_wav):
+    """Run the default inline-code iterate once and share the parsed JSON.
+
+    Tests that only inspect this output reuse one render + analysis, with
+    the render itself stubbed by the prerendered WAV. The JSON is parsed
+    here once; the returned dict is shared, so tests must not mutate it.
+    """
+    with patch("audioloop.cli.do_render", _fake_render(prerendered_wav)):
+        result = _RUNNER.invoke(app, _inline_args(), catch_exceptions=False)
+
+    assert result.exit_code == 0, f"Command failed: {result.stderr}"
+
+    return json.loads(result.stdout)
+
+
+class TestIterateInlineCode:
+    """Tests for inline code mode with --code flag."""
+
+    def test_inline_code_success(self, iterate_json_output):
+        """Inline code with --code and --duration renders and analyzes successfully."""
+        data = iterate_json_output
         assert data["success"] is True
         assert data["render"]["success"] is True
         assert data["analysis"] is not None
@@ -42,18 +138,17 @@ class TestIterateInlineCode:
 
     def test_inline_code_missing_duration(self):
         """Inline code without --duration returns error with exit code 2."""
-        result = subprocess.run(
+        result = _RUNNER.invoke(
+            app,
             [
-                "uv", "run", "audioloop", "iterate",
+                "iterate",
                 "--code",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
+                INLINE_CODE,
                 "--json", "--no-play"
             ],
-            capture_output=True,
-            text=True,
         )
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
 
         data = json.loads(result.stdout)
         assert data["success"] is False
@@ -65,21 +160,23 @@ class TestIterateInlineCode:
 class TestIterateFileMode:
     """Tests for file path mode."""
 
+    @requires_sc
     def test_file_mode_success(self):
-        """Existing simple function file renders and analyzes successfully."""
-        result = subprocess.run(
+        """Existing simple function file renders and analyzes successfully.
+
+        End-to-end smoke test: the only iterate test using a real SC render.
+        """
+        result = _RUNNER.invoke(
+            app,
             [
-                "uv", "run", "audioloop", "iterate",
+                "iterate",
                 str(SIMPLE_FUNCTION),
                 "-d", "1",
                 "--json", "--no-play"
             ],
-            capture_output=True,
-            text=True,
-            timeout=60,
         )
 
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
+        assert result.exit_code == 0, f"Command failed: {result.stderr}"
 
         data = json.loads(result.stdout)
         assert data["success"] is True
@@ -89,18 +186,17 @@ class TestIterateFileMode:
 
     def test_file_not_found(self):
         """Non-existent file returns error with exit code 2."""
-        result = subprocess.run(
+        result = _RUNNER.invoke(
+            app,
             [
-                "uv", "run", "audioloop", "iterate",
+                "iterate",
                 "nonexistent_file.scd",
                 "-d", "1",
                 "--json", "--no-play"
             ],
-            capture_output=True,
-            text=True,
         )
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
 
         data = json.loads(result.stdout)
         assert data["success"] is False
@@ -110,86 +206,41 @@ class TestIterateFileMode:
 class TestIterateOptions:
     """Tests for command options."""
 
-    def test_no_play_skips_playback(self):
+    def test_no_play_skips_playback(self, iterate_json_output):
         """--no-play flag results in played=false."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        data = json.loads(result.stdout)
+        data = iterate_json_output
         assert data["played"] is False
 
-    def test_no_psychoacoustic_excludes_metrics(self):
+    def test_no_psychoacoustic_excludes_metrics(self, capsys, stub_render):
         """--no-psychoacoustic flag excludes psychoacoustic metrics from analysis."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play", "--no-psychoacoustic"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        assert result.returncode == 0
+        data = _iterate_direct(capsys, no_psychoacoustic=True)
 
-        data = json.loads(result.stdout)
         assert data["success"] is True
         # Psychoacoustic should be empty dict when skipped
         assert data["analysis"]["psychoacoustic"] == {}
 
-    def test_keep_preserves_output_file(self, tmp_path):
+    def test_keep_preserves_output_file(self, capsys, tmp_path, stub_render):
         """--keep flag preserves the output WAV file."""
         output_file = tmp_path / "test_output.wav"
 
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play",
-                "--output", str(output_file)
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        assert result.returncode == 0
+        data = _iterate_direct(capsys, output=output_file, keep=True)
 
-        data = json.loads(result.stdout)
         assert data["success"] is True
         assert data["output_path"] == str(output_file)
         assert output_file.exists()
 
-    def test_output_specifies_path(self, tmp_path):
-        """--output flag specifies output path."""
+    def test_output_specifies_path(self, tmp_path, stub_render):
+        """--output flag specifies output path.
+
+        Goes through the CLI runner to cover the -o argv wiring.
+        """
         output_file = tmp_path / "custom_output.wav"
 
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play",
-                "-o", str(output_file)
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
+        result = _RUNNER.invoke(
+            app, _inline_args("-o", str(output_file)), catch_exceptions=False
         )
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
 
         data = json.loads(result.stdout)
         assert data["output_path"] == str(output_file)
@@ -199,21 +250,9 @@ class TestIterateOptions:
 class TestIterateOutputValidation:
     """Tests for JSON output structure validation."""
 
-    def test_json_structure_complete(self):
+    def test_json_structure_complete(self, iterate_json_output):
         """JSON output has all expected top-level fields."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        data = json.loads(result.stdout)
+        data = iterate_json_output
 
         # Check all expected top-level keys
         assert "success" in data
@@ -223,21 +262,9 @@ class TestIterateOutputValidation:
         assert "output_path" in data
         assert "total_time_sec" in data
 
-    def test_render_section_complete(self):
+    def test_render_section_complete(self, iterate_json_output):
         """Render section has expected fields."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        data = json.loads(result.stdout)
+        data = iterate_json_output
         render = data["render"]
 
         assert "success" in render
@@ -246,21 +273,9 @@ class TestIterateOutputValidation:
         assert "render_time_sec" in render
         assert "mode" in render
 
-    def test_analysis_section_complete(self):
+    def test_analysis_section_complete(self, iterate_json_output):
         """Analysis section has expected structure when successful."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        data = json.loads(result.stdout)
+        data = iterate_json_output
         analysis = data["analysis"]
 
         assert "file" in analysis
@@ -272,21 +287,9 @@ class TestIterateOutputValidation:
         assert "stereo" in analysis
         assert "loudness_lufs" in analysis
 
-    def test_total_time_is_numeric(self):
+    def test_total_time_is_numeric(self, iterate_json_output):
         """total_time_sec is a valid number."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        data = json.loads(result.stdout)
+        data = iterate_json_output
         assert isinstance(data["total_time_sec"], (int, float))
         assert data["total_time_sec"] > 0
 
@@ -294,48 +297,35 @@ class TestIterateOutputValidation:
 class TestIterateExitCodes:
     """Tests for exit code correctness."""
 
-    def test_success_exit_code_zero(self):
+    def test_success_exit_code_zero(self, iterate_json_output):
         """Successful iterate returns exit code 0."""
-        result = subprocess.run(
-            [
-                "uv", "run", "audioloop", "iterate",
-                "--code", "-d", "1",
-                "{ SinOsc.ar(440) * 0.3 ! 2 }",
-                "--json", "--no-play"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        assert result.returncode == 0
+        # The fixture asserts exit code 0; the JSON must agree
+        assert iterate_json_output["success"] is True
 
     def test_file_not_found_exit_code_two(self):
         """File not found returns exit code 2 (system error)."""
-        result = subprocess.run(
+        result = _RUNNER.invoke(
+            app,
             [
-                "uv", "run", "audioloop", "iterate",
+                "iterate",
                 "nonexistent.scd",
                 "-d", "1",
                 "--json", "--no-play"
             ],
-            capture_output=True,
-            text=True,
         )
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
 
     def test_missing_duration_exit_code_two(self):
         """Missing required duration returns exit code 2 (system error)."""
-        result = subprocess.run(
+        result = _RUNNER.invoke(
+            app,
             [
-                "uv", "run", "audioloop", "iterate",
+                "iterate",
                 "--code",
                 "{ SinOsc.ar(440) }",
                 "--json", "--no-play"
             ],
-            capture_output=True,
-            text=True,
         )
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
@@ -1,16 +1,20 @@
 """Tests for the play command."""
 
-import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from typer.testing import CliRunner
 
+from audioloop.cli import app
 from audioloop.play import play_audio, PlaybackError
 
 
 # Use the test fixture created for CLI tests
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "test_tone.wav"
+FIXTURE_PATH_STR = str(FIXTURE_PATH)
+
+_RUNNER = CliRunner()
 
 
 class TestPlayAudioFunction:
@@ -26,7 +30,7 @@ class TestPlayAudioFunction:
             mock_run.assert_called_once()
             call_args = mock_run.call_args[0][0]
             assert call_args[0] == "afplay"
-            assert str(FIXTURE_PATH) in call_args[1]
+            assert FIXTURE_PATH_STR in call_args[1]
 
     def test_play_nonexistent_file(self):
         """Verify FileNotFoundError raised for nonexistent file."""
@@ -54,54 +58,39 @@ class TestPlayAudioFunction:
 
 
 class TestPlayCLI:
-    """CLI integration tests for the play command."""
+    """CLI integration tests for the play command.
+
+    The command checks that the file exists before reaching afplay, so the
+    error-path tests need no stub. Any test that gets past that check must
+    patch audioloop.play.subprocess.run so CI never plays real audio.
+    Because afplay is never actually run, these tests are not macOS-only.
+    """
 
     def test_play_cli_output(self):
         """Verify 'Playing:' and 'Played:' messages in CLI output."""
-        from typer.testing import CliRunner
-        from audioloop.cli import app
-
         # Mock subprocess at the module level to prevent actual playback
         with patch("audioloop.play.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stderr="")
 
-            runner = CliRunner()
-            result = runner.invoke(app, ["play", str(FIXTURE_PATH)])
+            result = _RUNNER.invoke(
+                app, ["play", FIXTURE_PATH_STR], catch_exceptions=False
+            )
 
             assert result.exit_code == 0
             assert "Playing:" in result.stdout
             assert "Played:" in result.stdout
-            assert str(FIXTURE_PATH) in result.stdout
+            assert FIXTURE_PATH_STR in result.stdout
 
     def test_play_nonexistent_file_exit_code(self):
         """Verify exit code 2 for nonexistent file."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "play", "nonexistent_file.wav"],
-            capture_output=True,
-            text=True,
-        )
+        # Fails the existence check before afplay, so no subprocess stub
+        result = _RUNNER.invoke(app, ["play", "nonexistent_file.wav"])
 
-        assert result.returncode == 2
+        assert result.exit_code == 2
         assert "not found" in result.stderr.lower() or "not found" in result.stdout.lower()
 
     def test_play_directory_exit_code(self, tmp_path):
         """Verify exit code 2 when path is a directory."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "play", str(tmp_path)],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 2
-
-    def test_play_help(self):
-        """Verify play command appears in help output."""
-        result = subprocess.run(
-            ["uv", "run", "audioloop", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "play" in result.stdout.lower()
-        assert "audio" in result.stdout.lower()
+        result = _RUNNER.invoke(app, ["play", str(tmp_path)])
+
+        assert result.exit_code == 2
@@ -1,118 +1,153 @@
 """Integration tests for the render module."""
 
+import dataclasses
 import json
-import tempfile
+import re
+import subprocess
 from pathlib import Path
 
 import pytest
 
 from audioloop.render import render, RenderResult
-from audioloop.sc_paths import validate_sc_installation
+from audioloop.sc_paths import get_sclang_dir_str, get_sclang_path_str
+from audioloop.sclang import sclang_env
+from tests.sc_support import SC_OK, SC_SKIP_REASON, requires_sc
 
 
-# Check if SuperCollider is available
-def sc_available() -> bool:
-    """Check if SuperCollider is installed and available."""
-    is_valid, _ = validate_sc_installation()
-    return is_valid
+# Each render spawns its own sclang (and NRT scsynth) and writes only under
+# tmp_path / tmp_path_factory, so these tests spread across workers under
+# the default `-n auto`. A session fixture is built once per worker, so its
+# consumers share an xdist_group to land on one worker and one render.
+shares_full_nrt = pytest.mark.xdist_group("full_nrt")
 
 
-# Skip marker for tests requiring SC
-requires_sc = pytest.mark.skipif(
-    not sc_available(),
-    reason="SuperCollider not installed"
-)
-
-
-# Fixture paths
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
+# Fixture paths, resolved once at import so every render() call gets a
+# canonical path (not strict: missing fixtures fail in the tests that use them)
+FIXTURES_DIR = (Path(__file__).parent / "fixtures").resolve()
 FULL_NRT_FIXTURE = FIXTURES_DIR / "full_nrt.scd"
 SIMPLE_FUNCTION_FIXTURE = FIXTURES_DIR / "simple_function.scd"
 SYNTAX_ERROR_FIXTURE = FIXTURES_DIR / "syntax_error.scd"
 RUNTIME_ERROR_FIXTURE = FIXTURES_DIR / "runtime_error.scd"
 
 
-@pytest.fixture
-def temp_wav_path():
-    """Provide a temporary WAV file path and clean up after test."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        path = Path(f.name)
-    yield path
-    # Cleanup
-    if path.exists():
-        path.unlink()
+@pytest.fixture(scope="session")
+def full_nrt_result(tmp_path_factory) -> tuple[Path, RenderResult]:
+    """Render full_nrt.scd once and share the result across read-only tests.
+
+    Each render pays for sclang startup plus the NRT run, so the tests that
+    only inspect the result reuse this one. The output goes to a
+    non-default filename to also cover custom output paths.
+
+    Returns:
+        (requested_path, result), with requested_path resolved up front
+        (macOS /var -> /private/var) to match the path render() reports.
+    """
+    if not SC_OK:
+        pytest.skip(SC_SKIP_REASON)
+
+    requested_path = (tmp_path_factory.mktemp("nrt") / "custom_output.wav").resolve()
+    result = render(
+        input_path=FULL_NRT_FIXTURE,
+        output_path=requested_path,
+        timeout=60.0,
+    )
+    return requested_path, result
+
+
+@pytest.fixture(scope="session")
+def sclang_hangs_on_syntax_error() -> None:
+    """Skip unless the installed sclang hangs on a syntax error.
+
+    SC 3.14.x and earlier hang instead of exiting, which is what the timeout
+    test relies on. Runs `sclang -v` only when a test requests this fixture;
+    an unknown version is assumed to hang so the test still runs.
+    """
+    try:
+        result = subprocess.run(
+            [get_sclang_path_str(), "-v"],
+            cwd=get_sclang_dir_str(),
+            capture_output=True,
+            timeout=10.0,
+            env=sclang_env(),
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return
+
+    match = re.search(rb"sclang (\d+)\.(\d+)", result.stdout + result.stderr)
+    if match is not None and (int(match[1]), int(match[2])) >= (3, 15):
+        pytest.skip("sclang exits on syntax errors, so the timeout is never reached")
+
+
+@pytest.fixture(scope="session")
+def syntax_error_result_20s(tmp_path_factory) -> RenderResult:
+    """Render syntax_error.scd once with a 20s timeout.
+
+    Syntax errors can leave sclang hanging until the timeout, so this is
+    the slowest render in the suite; share it rather than repeat it.
+    """
+    if not SC_OK:
+        pytest.skip(SC_SKIP_REASON)
+
+    return render(
+        input_path=SYNTAX_ERROR_FIXTURE,
+        output_path=tmp_path_factory.mktemp("syntax_error") / "out.wav",
+        timeout=20.0,
+    )
+
+
+def _assert_nonempty(path: Path) -> None:
+    """Assert that `path` exists and is non-empty, with a single stat call."""
+    assert path.stat().st_size > 0
 
 
 class TestRenderFullNRT:
     """Tests for full NRT mode rendering."""
 
-    @requires_sc
-    def test_render_full_nrt(self, temp_wav_path: Path):
+    @shares_full_nrt
+    def test_render_full_nrt(self, full_nrt_result: tuple[Path, RenderResult]):
         """Renders full_nrt.scd and verifies WAV output."""
-        result = render(
-            input_path=FULL_NRT_FIXTURE,
-            output_path=temp_wav_path,
-            timeout=60.0,
-        )
+        requested_path, result = full_nrt_result
 
         assert result.success is True
         assert result.mode == "full_nrt"
-        # Use resolve() to handle macOS /var -> /private/var symlink
-        assert result.output_path == temp_wav_path.resolve()
-        assert result.output_path.exists()
-        assert result.output_path.stat().st_size > 0
+        # The fixture renders to a non-default filename, so this also covers
+        # custom output paths
+        assert result.output_path == requested_path
+        _assert_nonempty(result.output_path)
         assert result.duration_sec is not None
         assert result.duration_sec > 0.9  # Should be ~1 second
         assert result.error is None
 
-    @requires_sc
-    def test_render_full_nrt_custom_output_path(self, temp_wav_path: Path):
-        """Verifies custom output path works."""
-        custom_path = temp_wav_path.parent / "custom_output.wav"
-        try:
-            result = render(
-                input_path=FULL_NRT_FIXTURE,
-                output_path=custom_path,
-                timeout=60.0,
-            )
-
-            assert result.success is True
-            # Use resolve() to handle macOS /var -> /private/var symlink
-            assert result.output_path == custom_path.resolve()
-            assert custom_path.exists()
-        finally:
-            if custom_path.exists():
-                custom_path.unlink()
-
 
 class TestRenderWrapped:
     """Tests for wrapped function mode rendering."""
 
     @requires_sc
-    def test_render_wrapped_function(self, temp_wav_path: Path):
+    def test_render_wrapped_function(self, tmp_path: Path):
         """Renders simple_function.scd with --duration and verifies WAV."""
+        # Resolved up front (macOS /var -> /private/var) to match the
+        # absolute path render() reports
+        out = (tmp_path / "out.wav").resolve()
         result = render(
             input_path=SIMPLE_FUNCTION_FIXTURE,
-            output_path=temp_wav_path,
+            output_path=out,
             timeout=60.0,
             duration=2.0,
         )
 
         assert result.success is True
         assert result.mode == "wrapped"
-        # Use resolve() to handle macOS /var -> /private/var symlink
-        assert result.output_path == temp_wav_path.resolve()
-        assert result.output_path.exists()
-        assert result.output_path.stat().st_size > 0
+        assert result.output_path == out
+        _assert_nonempty(result.output_path)
         assert result.duration_sec is not None
         assert result.duration_sec > 1.9  # Should be ~2 seconds
         assert result.error is None
 
-    def test_render_wrapped_without_duration(self, temp_wav_path: Path):
+    def test_render_wrapped_without_duration(self, tmp_path: Path):
         """Verifies error when --duration missing for simple function."""
         result = render(
             input_path=SIMPLE_FUNCTION_FIXTURE,
-            output_path=temp_wav_path,
+            output_path=tmp_path / "out.wav",
             timeout=60.0,
             # No duration specified
         )
@@ -127,14 +162,9 @@ class TestRenderWrapped:
 class TestRenderErrors:
     """Tests for error handling."""
 
-    @requires_sc
-    def test_render_syntax_error(self, temp_wav_path: Path):
+    def test_render_syntax_error(self, syntax_error_result_20s: RenderResult):
         """Verifies error detection for syntax errors."""
-        result = render(
-            input_path=SYNTAX_ERROR_FIXTURE,
-            output_path=temp_wav_path,
-            timeout=20.0,  # Shorter timeout - syntax errors cause hang
-        )
+        result = syntax_error_result_20s
 
         assert result.success is False
         assert result.mode == "full_nrt"
@@ -143,11 +173,11 @@ class TestRenderErrors:
         assert "syntax" in result.error.message.lower() or "unexpected" in result.error.message.lower()
 
     @requires_sc
-    def test_render_runtime_error(self, temp_wav_path: Path):
+    def test_render_runtime_error(self, tmp_path: Path):
         """Verifies error detection for runtime errors."""
         result = render(
             input_path=RUNTIME_ERROR_FIXTURE,
-            output_path=temp_wav_path,
+            output_path=tmp_path / "out.wav",
             timeout=20.0,
         )
 
@@ -156,12 +186,12 @@ class TestRenderErrors:
         # Should mention the undefined variable
         assert "unknownVariable" in result.error.message or "not defined" in result.error.message.lower()
 
-    def test_render_missing_file(self, temp_wav_path: Path):
+    def test_render_missing_file(self, tmp_path: Path):
         """Verifies clean error for nonexistent input file."""
-        nonexistent = Path("/nonexistent/path/file.scd")
+        nonexistent = tmp_path / "missing.scd"
         result = render(
             input_path=nonexistent,
-            output_path=temp_wav_path,
+            output_path=tmp_path / "out.wav",
             timeout=60.0,
         )
 
@@ -171,13 +201,15 @@ class TestRenderErrors:
         assert "not found" in result.error.message.lower()
 
     @requires_sc
-    def test_render_timeout(self, temp_wav_path: Path):
+    @pytest.mark.usefixtures("sclang_hangs_on_syntax_error")
+    def test_render_timeout(self, tmp_path: Path):
         """Verifies timeout handling with a script that would hang."""
         # Syntax error causes sclang to hang in SC 3.14.x
-        # Using a very short timeout to test timeout behavior
+        # Using a very short timeout to test timeout behavior, so this
+        # can't share the syntax_error_result_20s render
         result = render(
             input_path=SYNTAX_ERROR_FIXTURE,
-            output_path=temp_wav_path,
+            output_path=tmp_path / "out.wav",
             timeout=5.0,  # Very short timeout
         )
 
@@ -190,92 +222,55 @@ class TestRenderErrors:
 class TestRenderResult:
     """Tests for RenderResult structure."""
 
-    @requires_sc
-    def test_render_result_structure(self, temp_wav_path: Path):
+    @shares_full_nrt
+    def test_render_result_structure(self, full_nrt_result: tuple[Path, RenderResult]):
         """Verifies RenderResult has all expected fields."""
-        result = render(
-            input_path=FULL_NRT_FIXTURE,
-            output_path=temp_wav_path,
-            timeout=60.0,
-        )
+        _, result = full_nrt_result
 
         # Check all fields exist
-        assert hasattr(result, "success")
-        assert hasattr(result, "output_path")
-        assert hasattr(result, "duration_sec")
-        assert hasattr(result, "render_time_sec")
-        assert hasattr(result, "error")
-        assert hasattr(result, "sclang_output")
-        assert hasattr(result, "mode")
+        expected = {
+            "success",
+            "output_path",
+            "duration_sec",
+            "render_time_sec",
+            "error",
+            "sclang_output",
+            "mode",
+        }
+        assert expected <= {f.name for f in dataclasses.fields(result)}
 
         # Check types
         assert isinstance(result.success, bool)
         assert isinstance(result.render_time_sec, float)
         assert isinstance(result.mode, str)
 
-    @requires_sc
-    def test_json_output_format(self, temp_wav_path: Path):
+    @shares_full_nrt
+    def test_json_output_format(self, full_nrt_result: tuple[Path, RenderResult]):
         """Verifies JSON output matches expected schema."""
-        result = render(
-            input_path=FULL_NRT_FIXTURE,
-            output_path=temp_wav_path,
-            timeout=60.0,
-        )
+        _, result = full_nrt_result
 
-        # Build JSON output as CLI would
-        output_data = {
-            "success": result.success,
-            "output_path": str(result.output_path) if result.output_path else None,
-            "duration_sec": result.duration_sec,
-            "render_time_sec": round(result.render_time_sec, 3),
-            "mode": result.mode,
-        }
-        if result.error:
-            output_data["error"] = {
-                "message": result.error.message,
-                "file": result.error.file,
-                "line": result.error.line,
-                "char": result.error.char,
-            }
-
-        # Should be valid JSON
-        json_str = json.dumps(output_data)
-        parsed = json.loads(json_str)
-
-        assert parsed["success"] is True
-        assert parsed["mode"] == "full_nrt"
-        assert "output_path" in parsed
-        assert "duration_sec" in parsed
-        assert "render_time_sec" in parsed
-
-    def test_json_output_format_error(self, temp_wav_path: Path):
+        output_data = result.to_dict()
+        # Should be valid JSON (serializing is enough; no need to parse back)
+        json.dumps(output_data)
+
+        assert output_data["success"] is True
+        assert output_data["mode"] == "full_nrt"
+        assert "output_path" in output_data
+        assert "duration_sec" in output_data
+        assert "render_time_sec" in output_data
+
+    def test_json_output_format_error(self, tmp_path: Path):
         """Verifies JSON output with error matches expected schema."""
         result = render(
             input_path=SIMPLE_FUNCTION_FIXTURE,
-            output_path=temp_wav_path,
+            output_path=tmp_path / "out.wav",
             # Missing duration - will fail
         )
 
-        # Build JSON output as CLI would
-        output_data = {
-            "success": result.success,
-            "output_path": str(result.output_path) if result.output_path else None,
-            "duration_sec": result.duration_sec,
-            "render_time_sec": round(result.render_time_sec, 3),
-            "mode": result.mode,
-        }
-        if result.error:
-            output_data["error"] = {
-                "message": result.error.message,
-                "file": result.error.file,
-                "line": result.error.line,
-                "char": result.error.char,
-            }
-
-        # Should be valid JSON
-        json_str = json.dumps(output_data)
-        parsed = json.loads(json_str)
-
-        assert parsed["success"] is False
-        assert "error" in parsed
-        assert "message" in parsed["error"]
+        output_data = result.to_dict()
+        # Should be valid JSON (serializing is enough; no need to parse back)
+        json.dumps(output_data)
+
+        assert output_data["success"] is False
+        assert "error" in output_data
+        assert "message" in output_data["error"]
@@ -0,0 +1,57 @@
+"""Tests for the sc_paths module."""
+
+import pytest
+
+from audioloop.sc_paths import (
+    get_sc_app_path,
+    get_sclang_path,
+    get_sclang_path_str,
+    invalidate_sc_cache,
+    validate_sc_installation,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_sc_cache():
+    """Reset cached paths around each test so env changes take effect."""
+    invalidate_sc_cache()
+    yield
+    invalidate_sc_cache()
+
+
+class TestScPathCache:
+    """Tests for memoized path lookup and validation."""
+
+    def test_paths_cached_until_invalidated(self, tmp_path, monkeypatch):
+        """Env var changes are picked up only after invalidate_sc_cache()."""
+        first = tmp_path / "First.app"
+        second = tmp_path / "Second.app"
+
+        monkeypatch.setenv("AUDIOLOOP_SC_APP", str(first))
+        assert get_sc_app_path() == first
+
+        monkeypatch.setenv("AUDIOLOOP_SC_APP", str(second))
+        assert get_sc_app_path() == first
+
+        invalidate_sc_cache()
+        assert get_sc_app_path() == second
+        assert get_sclang_path() == second / "Contents" / "MacOS" / "sclang"
+        assert get_sclang_path_str() == str(get_sclang_path())
+
+    def test_validation_result_cached(self, tmp_path, monkeypatch):
+        """Validation is computed once and re-checked after invalidation."""
+        sc_app = tmp_path / "SuperCollider.app"
+        monkeypatch.setenv("AUDIOLOOP_SC_APP", str(sc_app))
+
+        is_valid, error = validate_sc_installation()
+        assert is_valid is False
+        assert "SuperCollider not found" in error
+
+        # Creating the app dir doesn't change the cached result
+        sc_app.mkdir()
+        assert validate_sc_installation() == (is_valid, error)
+
+        invalidate_sc_cache()
+        is_valid, error = validate_sc_installation()
+        assert is_valid is False
+        assert "sclang executable not found" in error
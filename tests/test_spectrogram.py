@@ -0,0 +1,52 @@
+"""Tests for the spectrogram module."""
+
+import librosa
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audioloop.spectrogram import _mel_filterbank, generate_spectrogram
+
+
+SAMPLE_RATE = 22050
+
+
+@pytest.fixture(scope="module")
+def chord():
+    """One second of an A major triad, as float32 mono."""
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    y = sum(np.sin(2 * np.pi * f * t) for f in (440.0, 554.37, 659.25))
+    return (0.3 * y).astype(np.float32)
+
+
+class TestMelSpectrogram:
+    """Tests for the hand-rolled mel spectrogram."""
+
+    def test_matches_librosa_melspectrogram(self, chord):
+        """Cached filterbank @ |STFT|^2 equals librosa.feature.melspectrogram."""
+        S_power = np.abs(librosa.stft(chord, n_fft=2048, hop_length=512)) ** 2
+        ours = _mel_filterbank(SAMPLE_RATE, 2048, 128) @ S_power
+
+        expected = librosa.feature.melspectrogram(
+            y=chord, sr=SAMPLE_RATE, n_fft=2048, hop_length=512, n_mels=128
+        )
+
+        assert ours.shape == expected.shape
+        assert np.allclose(ours, expected)
+
+
+class TestGenerateSpectrogram:
+    """Tests for the generate_spectrogram function."""
+
+    def test_writes_nonempty_png(self, chord, tmp_path):
+        """A PNG is written for a short WAV."""
+        wav_path = tmp_path / "chord.wav"
+        sf.write(wav_path, chord, SAMPLE_RATE)
+        png_path = tmp_path / "chord.png"
+
+        result = generate_spectrogram(wav_path, png_path)
+
+        assert result == png_path
+        assert png_path.stat().st_size > 0
+        with open(png_path, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
@@ -2,98 +2,88 @@
 
 from pathlib import Path
 
+import pytest
+
 from audioloop.wrapper import needs_wrapping, wrap_function, replace_placeholders
 
 
+# needs_wrapping inputs
+COMPLEX_FUNCTION = """
+{
+    var sig = SinOsc.ar(440);
+    LPF.ar(sig, 1000) * 0.5
+}
+"""
+
+FULL_NRT_CODE = """
+(
+var score = Score([]);
+score.recordNRT(
+    outputFilePath: "__OUTPUT_PATH__",
+    duration: 1.0
+);
+)
+"""
+
+# recordNRT in a comment still counts (conservative) - if it appears
+# anywhere, we assume the user knows what they're doing
+RECORDNRT_IN_COMMENT = """
+// This uses recordNRT for rendering
+{ SinOsc.ar(440) }
+"""
+
+
 class TestNeedsWrapping:
     """Tests for the needs_wrapping function."""
 
-    def test_needs_wrapping_simple_function(self):
-        """Simple function returns True."""
-        code = "{ SinOsc.ar(440) }"
-        assert needs_wrapping(code) is True
-
-    def test_needs_wrapping_complex_function(self):
-        """Complex function without recordNRT returns True."""
-        code = """
-        {
-            var sig = SinOsc.ar(440);
-            LPF.ar(sig, 1000) * 0.5
-        }
-        """
-        assert needs_wrapping(code) is True
-
-    def test_needs_wrapping_full_nrt(self):
-        """Full NRT code returns False."""
-        code = """
-        (
-        var score = Score([]);
-        score.recordNRT(
-            outputFilePath: "__OUTPUT_PATH__",
-            duration: 1.0
-        );
-        )
-        """
-        assert needs_wrapping(code) is False
-
-    def test_needs_wrapping_recordnrt_in_comment(self):
-        """recordNRT in a comment should still return False (conservative)."""
-        # This is conservative behavior - if recordNRT appears anywhere,
-        # we assume the user knows what they're doing.
-        code = """
-        // This uses recordNRT for rendering
-        { SinOsc.ar(440) }
-        """
-        assert needs_wrapping(code) is False
+    @pytest.mark.parametrize(
+        "code,expected",
+        [
+            ("{ SinOsc.ar(440) }", True),
+            (COMPLEX_FUNCTION, True),
+            (FULL_NRT_CODE, False),
+            (RECORDNRT_IN_COMMENT, False),
+        ],
+        ids=["simple_function", "complex_function", "full_nrt", "recordnrt_in_comment"],
+    )
+    def test_needs_wrapping(self, code, expected):
+        """Only code without recordNRT needs wrapping."""
+        assert needs_wrapping(code) is expected
 
 
 class TestWrapFunction:
     """Tests for the wrap_function function."""
 
-    def test_wrap_function_generates_valid_code(self):
-        """Wrapped code contains NRT boilerplate."""
-        code = "{ SinOsc.ar(440) }"
-        output_path = Path("/tmp/output.wav")
-        result = wrap_function(code, duration=2.0, output_path=output_path)
-
-        # Should contain key NRT elements
-        assert "recordNRT" in result
-        assert "SynthDef" in result
-        assert "Score" in result
-        assert "0.exit" in result
-
-    def test_wrap_function_includes_user_code(self):
-        """User code is included in wrapped output."""
-        code = "{ SinOsc.ar(440) * 0.3 ! 2 }"
-        output_path = Path("/tmp/output.wav")
-        result = wrap_function(code, duration=2.0, output_path=output_path)
-
-        assert "SinOsc.ar(440) * 0.3 ! 2" in result
-
-    def test_wrap_function_includes_duration(self):
-        """Duration is included in wrapped output."""
-        code = "{ SinOsc.ar(440) }"
-        output_path = Path("/tmp/output.wav")
-        result = wrap_function(code, duration=3.5, output_path=output_path)
-
-        assert "3.5" in result
-
-    def test_wrap_function_includes_output_path(self):
-        """Output path is included in wrapped output."""
-        code = "{ SinOsc.ar(440) }"
+    def test_wrap_function_embeds_all_fields(self):
+        """Wrapped code has NRT boilerplate plus user code, duration and path."""
+        # Padded user code also checks that whitespace is stripped
+        code = "  { SinOsc.ar(440) * 0.3 ! 2 }  \n"
         output_path = Path("/tmp/my_output.wav")
-        result = wrap_function(code, duration=2.0, output_path=output_path)
-
-        assert "/tmp/my_output.wav" in result
+        result = wrap_function(code, duration=3.5, output_path=output_path)
 
-    def test_wrap_function_strips_whitespace(self):
-        """User code whitespace is stripped."""
-        code = "  { SinOsc.ar(440) }  \n"
+        for needle in (
+            # NRT boilerplate
+            "recordNRT",
+            "SynthDef",
+            "Score",
+            "0.exit",
+            # User code, duration and output path
+            "userFunc = { SinOsc.ar(440) * 0.3 ! 2 }",
+            "3.5",
+            "/tmp/my_output.wav",
+        ):
+            assert needle in result, f"{needle!r} missing from wrapped code"
+
+    def test_wrap_function_preserves_user_braces(self):
+        """User code braces are inserted verbatim, not treated as format fields."""
+        code = "{ |freq={duration}| SinOsc.ar(freq) }"
         output_path = Path("/tmp/output.wav")
         result = wrap_function(code, duration=2.0, output_path=output_path)
 
-        # Code should be stripped
-        assert "userFunc = { SinOsc.ar(440) }" in result
+        assert "userFunc = { |freq={duration}| SinOsc.ar(freq) }" in result
+        # Template braces are un-doubled in the output
+        assert "{{" not in result
+        assert "}}" not in result
 
 
 class TestReplacePlaceholders:
@@ -138,3 +128,15 @@ class TestReplacePlaceholders:
         assert "__DURATION__" not in result
         assert '"/tmp/test.wav"' in result
         assert "2.0" in result
+
+    def test_replace_placeholders_single_pass(self):
+        """Placeholders are substituted in one pass over the source.
+
+        A placeholder appearing inside a substituted value is left alone,
+        which sequential str.replace calls would not guarantee.
+        """
+        code = 'path = "__OUTPUT_PATH__"; dur = __DURATION__;'
+        output_path = Path("/tmp/__DURATION__.wav")
+        result = replace_placeholders(code, output_path, duration=2.0)
+
+        assert result == 'path = "/tmp/__DURATION__.wav"; dur = 2.0;'